@@ -0,0 +1,111 @@
+"""
+Нагрузочный тест ConsoleManager.dispatch из нескольких потоков.
+Каждый поток выполняет одинаковое число команд sum и rand и проверяет результаты,
+параллельно отдельный поток регистрирует новые команды, нагружая таблицу команд.
+Измеряется суммарная пропускная способность в зависимости от числа потоков.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_concurrency
+    python -m benchmarks.bench_concurrency --threads 1 2 4 8 16 --ops 5000
+На сборках Python без GIL (free-threaded) пропускная способность должна расти с числом потоков.
+"""
+import argparse
+import sys
+import threading
+import time
+
+from src.logic import ConsoleMathFuncs, MathFuncs
+from src.tools.console import ConsoleManager
+
+LINES = (
+    ("sum 1 2 3 4 5 6 7 8 9 10", 55),
+    ("sum -p -sort 5 -3 8 -1 2", 15),
+    ("sum -n 5 -3 8 -1 2", -4),
+    ("rand -uniform 20 0 100 -sort", None),
+)
+
+
+def _build_manager() -> ConsoleManager:
+    console_manager = ConsoleManager("bench")
+    ConsoleMathFuncs(MathFuncs())._register_commands(console_manager)
+    return console_manager
+
+
+def _worker(console_manager: ConsoleManager, ops: int, barrier: threading.Barrier, errors: list[str]) -> None:
+    barrier.wait()
+    line = ""
+    try:
+        for i in range(ops):
+            line, expected = LINES[i % len(LINES)]
+            dispatch_result = console_manager.dispatch(line)
+            if not dispatch_result.ok:
+                errors.append(f"{line}: {dispatch_result.error.message}")
+            elif expected is not None and dispatch_result.result != expected:
+                errors.append(f"{line}: {dispatch_result.result} != {expected}")
+            elif expected is None and len(dispatch_result.result) != 20:
+                errors.append(f"{line}: {dispatch_result.result}")
+    except Exception as ex:
+        # Исключение завершает поток, поэтому оно тоже считается ошибкой
+        errors.append(f"{line}: {type(ex).__name__}: {ex}")
+
+
+def _registrar(console_manager: ConsoleManager, stop_event: threading.Event) -> None:
+    i = 0
+    while not stop_event.is_set():
+        console_manager.register_command(lambda: None, [f"cmd{i}"], "Stress command", print_result=False)
+        i += 1
+        time.sleep(0.001)
+
+
+def run(thread_count: int, ops: int) -> tuple[float, list[str]]:
+    console_manager = _build_manager()
+    errors: list[str] = []
+    barrier = threading.Barrier(thread_count + 1)
+    stop_event = threading.Event()
+
+    workers = [
+        threading.Thread(target=_worker, args=(console_manager, ops, barrier, errors))
+        for _ in range(thread_count)
+    ]
+    registrar = threading.Thread(target=_registrar, args=(console_manager, stop_event))
+    for worker in workers:
+        worker.start()
+    registrar.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    stop_event.set()
+    registrar.join()
+    return thread_count * ops / elapsed, errors
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Нагрузочный тест ConsoleManager.dispatch из нескольких потоков")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8], help="Количество потоков (один поток прогоняется всегда)")
+    parser.add_argument("--ops", type=int, default=2000, help="Количество команд на один поток")
+    args = parser.parse_args(argv)
+
+    gil_enabled = sys._is_gil_enabled() if hasattr(sys, "_is_gil_enabled") else True
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled else 'disabled'}")
+    print(f"{'threads':>8}{'ops/s':>12}{'speedup':>9}")
+
+    # Ускорение считается относительно одного потока, поэтому он прогоняется всегда и первым
+    thread_counts = [1, *(thread_count for thread_count in args.threads if thread_count != 1)]
+    single_thread_ops = None
+    failed = False
+    for thread_count in thread_counts:
+        ops_per_sec, errors = run(thread_count, args.ops)
+        single_thread_ops = single_thread_ops or ops_per_sec
+        print(f"{thread_count:>8}{ops_per_sec:>12.1f}{ops_per_sec / single_thread_ops:>8.2f}x")
+        for error in errors[:5]:
+            print(f"  {error}")
+        failed = failed or bool(errors)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+"""
+Бенчмарк полного пути обработки строки консольным менеджером:
+ConsoleManager.execute_line -> shlex -> Command.get_params -> convert_args -> action
+-> параметры RESULT_MODIFY -> вывод через rich.Console.
+
+Время обработки строки сохраняется не в абсолютных ops/s, а в долях времени калибровочного цикла,
+который выполняется в том же процессе непосредственно перед каждым случаем. Так baseline меньше зависит
+от машины и её текущей загрузки. К порогу добавляется разброс текущих замеров, но не больше
+NOISE_ALLOWANCE от порога. Случай, превысивший порог, перед провалом перемеряется до --retries раз.
+
+Память: пиковый объём, выделяемый за одну обработку строки (tracemalloc), и число блоков памяти,
+оставшихся выделенными после неё (sys.getallocatedblocks). Общее число выделений за обработку
+средствами чистого Python не измеряется. Число оставшихся блоков шумит из-за кэшей rich
+и выводится только для информации, в сравнении с baseline не участвует.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_dispatch            # сравнить с baseline.json
+    python -m benchmarks.bench_dispatch --save     # перезаписать baseline.json
+Код возврата 1, если хотя бы один случай деградировал сильнее порога.
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import shlex
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Callable, Any
+
+import numpy as np
+from rich.console import Console
+from rich.text import Text
+
+from src.logic import ConsoleMathFuncs, MathFuncs
+from src.tools.console import ConsoleManager
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+SIZES = (10, 100, 1000)
+# Доля порога, на которую его может расширить шум замеров
+NOISE_ALLOWANCE = 0.25
+
+
+@dataclass
+class CaseResult:
+    name: str
+    ops_per_sec: float
+    relative_cost: float
+    noise: float
+    peak_kib_per_op: float
+    retained_blocks_per_op: float
+
+
+def _build_cases() -> dict[str, str]:
+    rng = random.Random(0)
+    cases = {}
+    for size in SIZES:
+        numbers = " ".join(str(rng.randint(-1000, 1000)) for _ in range(size))
+        cases[f"sum-{size}"] = f"sum {numbers}"
+        cases[f"sum-p-sort-{size}"] = f"sum -p -sort {numbers}"
+        cases[f"rand-uniform-sort-{size}"] = f"rand -uniform {size} 0 1000 -sort"
+        cases[f"rand-normal-sort-{size}"] = f"rand -normal {size} 0 100 -sort"
+    return cases
+
+
+def _build_manager(sink) -> ConsoleManager:
+    console = Console(file=sink, force_terminal=True, width=120)
+    console_math_funcs = ConsoleMathFuncs(MathFuncs())
+    console_math_funcs.console = console
+
+    console_manager = ConsoleManager("bench")
+    console_manager.console = console
+    console_math_funcs._register_commands(console_manager)
+    return console_manager
+
+
+def _calibration_loop() -> None:
+    # Чистый Python той же природы, что и обработка команды: разбор строки, преобразование и сортировка
+    numbers = [int(arg) for arg in shlex.split("sum 5 -3 8 -1 2 13 21 -34 55 89")[1:]]
+    sorted(filter(lambda n: n > 0, numbers))
+    Text(str(numbers), style="red")
+
+
+def _measure_time(func: Callable[[], Any], min_time: float, repeats: int) -> tuple[float, float]:
+    # Подбор числа итераций, чтобы один замер длился не меньше min_time
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    samples = [elapsed / number]
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+
+    # Берётся лучший замер, разброс до нижнего квартиля служит оценкой шума
+    best = min(samples)
+    return best, statistics.quantiles(samples, n=4)[0] / best - 1
+
+
+def _measure_memory(console_manager: ConsoleManager, line: str, number: int) -> tuple[float, float]:
+    # Пиковый объём памяти, выделенной сверх текущего за одну обработку строки
+    console_manager.execute_line(line)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        peak_total = 0
+        for _ in range(number):
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            console_manager.execute_line(line)
+            _, peak = tracemalloc.get_traced_memory()
+            peak_total += peak - base
+    finally:
+        tracemalloc.stop()
+
+    # Блоки памяти, оставшиеся выделенными после обработки строки
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    for _ in range(number):
+        console_manager.execute_line(line)
+    gc.collect()
+    retained_blocks = sys.getallocatedblocks() - blocks_before
+    return peak_total / number / 1024, retained_blocks / number
+
+
+def _measure_case(
+        console_manager: ConsoleManager, name: str, line: str, min_time: float, repeats: int
+) -> CaseResult:
+    calibration_seconds, calibration_noise = _measure_time(_calibration_loop, min_time, repeats)
+    seconds, noise = _measure_time(lambda: console_manager.execute_line(line), min_time, repeats)
+    peak_kib, retained_blocks = _measure_memory(console_manager, line, number=20)
+    return CaseResult(
+        name, 1 / seconds, seconds / calibration_seconds, max(noise, calibration_noise),
+        peak_kib, retained_blocks
+    )
+
+
+def run_cases(
+        selected: list[str] | None, min_time: float, repeats: int,
+        baseline: dict[str, dict], threshold: float, retries: int
+) -> list[CaseResult]:
+    random.seed(0)
+    np.random.seed(0)
+    results = []
+    with open(os.devnull, "w") as sink:
+        console_manager = _build_manager(sink)
+        for name, line in _build_cases().items():
+            if selected and not any(pattern in name for pattern in selected):
+                continue
+            result = _measure_case(console_manager, name, line, min_time, repeats)
+            # Похожий на деградацию случай перемеряется, чтобы отсеять разовый всплеск нагрузки
+            for _ in range(retries):
+                if not _check_case(result, baseline.get(name), threshold):
+                    break
+                retry = _measure_case(console_manager, name, line, min_time, repeats)
+                if retry.relative_cost < result.relative_cost:
+                    result = retry
+            results.append(result)
+    return results
+
+
+def _check_case(result: CaseResult, base: dict | None, threshold: float) -> list[str]:
+    if not base:
+        return []
+    regressions = []
+    allowed = threshold + min(result.noise, threshold * NOISE_ALLOWANCE)
+    if result.relative_cost > base["relative_cost"] * (1 + allowed):
+        regressions.append(
+            f"{result.name}: relative cost {result.relative_cost:.2f} > {base['relative_cost']:.2f}"
+            f" (allowed +{allowed:.0%})"
+        )
+    if result.peak_kib_per_op > base["peak_kib_per_op"] * (1 + threshold):
+        regressions.append(
+            f"{result.name}: peak KiB/op {result.peak_kib_per_op:.1f} > {base['peak_kib_per_op']:.1f}"
+        )
+    return regressions
+
+
+def compare(results: list[CaseResult], baseline: dict[str, dict], threshold: float) -> list[str]:
+    regressions = []
+    for result in results:
+        regressions.extend(_check_case(result, baseline.get(result.name), threshold))
+    return regressions
+
+
+def _print_report(results: list[CaseResult], baseline: dict[str, dict]) -> None:
+    print(
+        f"{'case':<26}{'ops/s':>10}{'cost':>9}{'base':>9}{'change':>9}{'noise':>8}"
+        f"{'peak KiB':>10}{'blocks':>8}"
+    )
+    for result in results:
+        base = baseline.get(result.name)
+        base_cost = f"{base['relative_cost']:.2f}" if base else "-"
+        change = f"{result.relative_cost / base['relative_cost'] - 1:+.1%}" if base else "-"
+        print(
+            f"{result.name:<26}{result.ops_per_sec:>10.1f}{result.relative_cost:>9.2f}{base_cost:>9}{change:>9}"
+            f"{result.noise:>8.1%}{result.peak_kib_per_op:>10.1f}{result.retained_blocks_per_op:>8.1f}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарк обработки команд ConsoleManager")
+    parser.add_argument("-k", dest="selected", action="append", help="Запускать только случаи, содержащие подстроку")
+    parser.add_argument("--save", action="store_true", help="Сохранить результаты как новый baseline")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Путь к файлу baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Допустимая деградация (0.2 = 20%%)")
+    parser.add_argument("--min-time", type=float, default=0.02, help="Минимальная длительность одного замера, с")
+    parser.add_argument("--repeats", type=int, default=25, help="Количество замеров на случай")
+    parser.add_argument("--retries", type=int, default=2, help="Количество перемеров случая, превысившего порог")
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    retries = 0 if args.save else args.retries
+    results = run_cases(args.selected, args.min_time, args.repeats, baseline, args.threshold, retries)
+    _print_report(results, baseline)
+
+    if args.save:
+        # Абсолютные ops/s зависят от машины, а шум - от загрузки во время сохранения,
+        # поэтому в baseline они не сохраняются
+        for result in results:
+            case = asdict(result)
+            del case["name"], case["ops_per_sec"], case["noise"]
+            baseline[result.name] = case
+        args.baseline.write_text(json.dumps(baseline, indent=2, ensure_ascii=False) + "\n")
+        print(f"\nBaseline saved: {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\nRegressions (threshold {args.threshold:.0%}):")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -71,7 +71,7 @@ class ConsoleMathFuncs(BasicConsole):
         console_manager.register_command(
             aliases=["rand"],
             description="Сгенерировать список случайных чисел",
-            action=lambda: Text(f"Необходимо ввести параметры", style="red"),
+            action=self.rand_without_params,
             usage="rand <param_1> [param_2] ... [param_N]",
             params={
                 "-sort": Param(
@@ -104,23 +104,17 @@ class ConsoleMathFuncs(BasicConsole):
             }
         )
 
-    def generate_random_numbers_uniform(self, count: int, min_value: int, max_value: int) -> list[int] | Text:
-        try:
-            return self.original.generate_random_numbers_uniform(count, min_value, max_value)
-        except ValueError as e:
-            return Text(f"ValueError: {e}")
+    def rand_without_params(self) -> None:
+        raise ValueError("Необходимо ввести параметры")
 
-    def generate_random_numbers_normal(self, count: int, mean: int, std_dev: int) -> list[int] | Text:
-        try:
-            return self.original.generate_random_numbers_normal(count, mean, std_dev)
-        except ValueError as e:
-            return Text(f"ValueError: {e}")
+    def generate_random_numbers_uniform(self, count: int, min_value: int, max_value: int) -> list[int]:
+        return self.original.generate_random_numbers_uniform(count, min_value, max_value)
 
-    def generate_random_numbers_exponential(self, count: int, scale: float) -> list[int] | Text:
-        try:
-            return self.original.generate_random_numbers_exponential(count, scale)
-        except ValueError as e:
-            return Text(f"ValueError: {e}")
+    def generate_random_numbers_normal(self, count: int, mean: int, std_dev: int) -> list[int]:
+        return self.original.generate_random_numbers_normal(count, mean, std_dev)
+
+    def generate_random_numbers_exponential(self, count: int, scale: float) -> list[int]:
+        return self.original.generate_random_numbers_exponential(count, scale)
 
 
 if __name__ == "__main__":
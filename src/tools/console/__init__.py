@@ -1,13 +1,17 @@
+from .command_error import CommandError
 from .command import Command
 from .param import Param
 from .param_type import ParamType
+from .dispatch_result import DispatchResult
 from .console_manager import ConsoleManager
 from .basic_console import BasicConsole
 
 __all__ = [
+    "CommandError",
     "Command",
     "Param",
     "ParamType",
+    "DispatchResult",
     "ConsoleManager",
     "BasicConsole",
 ]
@@ -1,10 +1,11 @@
 import copy
 import inspect
 from typing import Callable, Any, Sequence
-from rich.text import Text
 from rich.console import Console
+from rich import get_console
 from src.tools.console.param import Param
 from src.tools.console.param_type import ParamType
+from src.tools.console.command_error import CommandError
 
 
 class Command:
@@ -123,7 +124,7 @@ class Command:
                 i += 1
         return used_params, tuple(new_args)
 
-    def execute(self, *args) -> Any:
+    def execute_or_raise(self, *args) -> Any:
         try:
             if not self.params:
                 return self.action(*self.convert_args(args)) if args else self.action()
@@ -136,28 +137,33 @@ class Command:
 
             # Параметры, модифицирующие переданные аргументы
             for param, param_args in used_params[ParamType.ARG_MODIFY]:
-                converted_args = param.execute(*param_args, *converted_args)
+                converted_args = param.execute_or_raise(*param_args, *converted_args)
 
             # Параметры, изменяющие основную логику
             result = None
             if used_params[ParamType.LOGIC]:
                 for param, param_args in used_params[ParamType.LOGIC]:
-                    result = param.execute(*param_args, *converted_args)
+                    result = param.execute_or_raise(*param_args, *converted_args)
             else:
                 result = self.action(*converted_args)
 
             # Параметры, модифицирующие результат
             for param, param_args in used_params[ParamType.RESULT_MODIFY]:
-                result = param.execute(*param_args, result)
+                result = param.execute_or_raise(*param_args, result)
 
             # Параметры, ничего не модифицирующие
             for param, param_args in used_params[ParamType.NO_MODIFY]:
-                param.execute(*param_args, *converted_args)
+                param.execute_or_raise(*param_args, *converted_args)
 
             return result
-        except (ValueError, TypeError) as ex:
-            result = Text(f"{ex}\n", style="red")
-            result.append("Usage: ", style="green")
-            result.append(f"{self.usage}", style="white")
-            Console().print(result)
+        except CommandError:
+            raise
+        except Exception as ex:
+            raise CommandError(str(ex), self.usage) from ex
+
+    def execute(self, *args, console: Console | None = None) -> Any:
+        try:
+            return self.execute_or_raise(*args)
+        except CommandError as ex:
+            (console or get_console()).print(ex.to_text())
             return None
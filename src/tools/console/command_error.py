@@ -0,0 +1,15 @@
+from rich.text import Text
+
+
+class CommandError(Exception):
+    def __init__(self, message: str, usage: str = '') -> None:
+        super().__init__(message)
+        self.message = message
+        self.usage = usage
+
+    def to_text(self) -> Text:
+        result = Text(f"{self.message}", style="red")
+        if self.usage:
+            result.append("\nUsage: ", style="green")
+            result.append(f"{self.usage}", style="white")
+        return result
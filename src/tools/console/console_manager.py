@@ -1,17 +1,22 @@
 import shlex
+import threading
 from typing import Callable, Any
 
 from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 
-from src.tools.console import Command, Param, ParamType
+from src.tools.console import Command, CommandError, DispatchResult, Param, ParamType
 
 
 class ConsoleManager:
     def __init__(self, name: str) -> None:
         self.name = name
-        self.is_running = True
+        self._running = threading.Event()
+        self._running.set()
+        # Таблица команд копируется при записи: поиск команды идёт без блокировок,
+        # а регистрация подменяет словарь целиком под _commands_lock
+        self._commands_lock = threading.Lock()
         self.commands: dict[str, Command] = {}
 
         self.console = Console()
@@ -38,6 +43,17 @@ class ConsoleManager:
             }
         )
 
+    @property
+    def is_running(self) -> bool:
+        return self._running.is_set()
+
+    @is_running.setter
+    def is_running(self, value: bool) -> None:
+        if value:
+            self._running.set()
+        else:
+            self._running.clear()
+
     def _get_help_aliases(self) -> str:
         for command in self.commands.values():
             if command.action == self._print_help:
@@ -168,28 +184,47 @@ class ConsoleManager:
         command = Command(
             action=action, aliases=aliases, description=description,
             usage=usage, print_result=print_result, params=params)
-        for alias in aliases:
-            self.commands[alias] = command
+        with self._commands_lock:
+            commands = dict(self.commands)
+            for alias in aliases:
+                commands[alias] = command
+            self.commands = commands
 
     def stop(self) -> None:
         self.is_running = False
 
-    def run(self) -> None:
-        self.is_running = True
-        while self.is_running:
-            command_line = input(f"\n{self.name}: ").strip()
-            if not command_line:
-                continue
+    def dispatch(self, command_line: str) -> DispatchResult:
+        """
+        Потокобезопасно выполняет строку команды и возвращает результат или ошибку, ничего не выводя на консоль.
+        Вывод выполняют только сами действия команд и параметров (например, параметры NO_MODIFY)
+        """
+        command_line = command_line.strip()
+        if not command_line:
+            return DispatchResult()
 
+        try:
             command_name, *args = shlex.split(command_line)
+        except ValueError as ex:
+            return DispatchResult(error=CommandError(str(ex)))
+
+        command_obj = self.commands.get(command_name)
+        if not command_obj:
+            return DispatchResult(error=CommandError(
+                f"Unknown command. Type {self._get_help_aliases()} for available commands."))
+
+        try:
+            return DispatchResult(command=command_obj, result=command_obj.execute_or_raise(*args))
+        except CommandError as ex:
+            return DispatchResult(command=command_obj, error=ex)
+
+    def execute_line(self, command_line: str) -> None:
+        dispatch_result = self.dispatch(command_line)
+        if dispatch_result.error:
+            self.console.print(dispatch_result.error.to_text())
+        elif dispatch_result.command and dispatch_result.command.print_result and dispatch_result.result:
+            self.console.print(dispatch_result.result)
 
-            command_obj = self.commands.get(command_name)
-            if not command_obj:
-                self.console.print(
-                    Text(f"Unknown command. Type {self._get_help_aliases()} for available commands.", style="red")
-                )
-                continue
-
-            result = command_obj.execute(*args)
-            if command_obj.print_result and result:
-                self.console.print(result)
+    def run(self) -> None:
+        self.is_running = True
+        while self.is_running:
+            self.execute_line(input(f"\n{self.name}: "))
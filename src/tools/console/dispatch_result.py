@@ -0,0 +1,20 @@
+from typing import Any
+from src.tools.console.command import Command
+from src.tools.console.command_error import CommandError
+
+
+class DispatchResult:
+    def __init__(
+            self,
+            *,
+            command: Command | None = None,
+            result: Any = None,
+            error: CommandError | None = None
+    ) -> None:
+        self.command = command
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
@@ -1,8 +1,9 @@
 import inspect
 from typing import Callable, Any, Sequence
-from src.tools.console.param_type import ParamType
-from rich.text import Text
 from rich.console import Console
+from rich import get_console
+from src.tools.console.param_type import ParamType
+from src.tools.console.command_error import CommandError
 
 
 class Param:
@@ -97,14 +98,18 @@ class Param:
         converted_args.extend(converted_kwonlyargs)
         return converted_args
 
-    def execute(self, *args) -> Any | Text:
+    def execute_or_raise(self, *args) -> Any:
         try:
             converted_args = self.convert_args(args) if self.arg_number else args
             return self.action(*converted_args)
-        except (ValueError, TypeError) as ex:
-            result = Text(f"{ex}\n", style="red")
-            if self.usage:
-                result.append("Usage: ", style="green")
-                result.append(f"{self.usage}", style="white")
-            Console().print(result)
+        except CommandError:
+            raise
+        except Exception as ex:
+            raise CommandError(str(ex), self.usage) from ex
+
+    def execute(self, *args, console: Console | None = None) -> Any:
+        try:
+            return self.execute_or_raise(*args)
+        except CommandError as ex:
+            (console or get_console()).print(ex.to_text())
             return None
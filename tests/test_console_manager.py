@@ -0,0 +1,151 @@
+import io
+import threading
+
+import pytest
+from rich.console import Console
+
+from src.logic import ConsoleMathFuncs, MathFuncs
+from src.tools.console import ConsoleManager
+
+
+@pytest.fixture
+def console_manager() -> ConsoleManager:
+    console_manager = ConsoleManager("test")
+    console_manager.console = Console(file=io.StringIO(), width=120)
+    ConsoleMathFuncs(MathFuncs())._register_commands(console_manager)
+    return console_manager
+
+
+def test_dispatch_returns_result(console_manager):
+    dispatch_result = console_manager.dispatch("sum -p -sort 5 -3 8")
+    assert dispatch_result.ok
+    assert dispatch_result.command is console_manager.commands["sum"]
+    assert dispatch_result.result == 13
+
+
+def test_dispatch_empty_line(console_manager):
+    dispatch_result = console_manager.dispatch("   ")
+    assert dispatch_result.ok
+    assert dispatch_result.command is None
+    assert dispatch_result.result is None
+
+
+def test_dispatch_unknown_command(console_manager):
+    dispatch_result = console_manager.dispatch("foo 1 2")
+    assert not dispatch_result.ok
+    assert dispatch_result.command is None
+    assert dispatch_result.error.message.startswith("Unknown command")
+
+
+def test_dispatch_shlex_error(console_manager):
+    dispatch_result = console_manager.dispatch('sum "a')
+    assert not dispatch_result.ok
+    assert dispatch_result.command is None
+    assert dispatch_result.error.message == "No closing quotation"
+
+
+def test_dispatch_param_error_carries_param_usage(console_manager):
+    dispatch_result = console_manager.dispatch("help -p")
+    assert not dispatch_result.ok
+    assert dispatch_result.error.usage == "help -p <command>"
+
+
+def test_dispatch_command_error_carries_command_usage(console_manager):
+    dispatch_result = console_manager.dispatch("sum 1 x")
+    assert not dispatch_result.ok
+    assert dispatch_result.error.usage == console_manager.commands["sum"].usage
+    assert isinstance(dispatch_result.error.__cause__, ValueError)
+
+
+def test_dispatch_failing_param_aborts_command(console_manager):
+    dispatch_result = console_manager.dispatch("rand -uniform 0 1 2 -sort")
+    assert not dispatch_result.ok
+    assert dispatch_result.result is None
+    assert dispatch_result.error.usage == "-uniform <count> <min value> <max value>"
+
+
+def test_dispatch_command_without_params_is_error(console_manager):
+    dispatch_result = console_manager.dispatch("rand")
+    assert not dispatch_result.ok
+    assert dispatch_result.error.usage == console_manager.commands["rand"].usage
+
+
+def test_dispatch_unexpected_exception_carries_param_usage(console_manager):
+    dispatch_result = console_manager.dispatch("rand -exp 3 1e400")
+    assert not dispatch_result.ok
+    assert dispatch_result.error.usage == "-exp <count> <scale>"
+    assert isinstance(dispatch_result.error.__cause__, OverflowError)
+
+
+def test_dispatch_unexpected_exception_carries_command_usage(console_manager):
+    console_manager.register_command(lambda: 1 / 0, ["div"], "Divide by zero", "div")
+    dispatch_result = console_manager.dispatch("div")
+    assert not dispatch_result.ok
+    assert dispatch_result.error.usage == "div"
+    assert isinstance(dispatch_result.error.__cause__, ZeroDivisionError)
+
+
+def test_command_registered_during_dispatch_is_visible(console_manager):
+    console_manager.register_command(
+        lambda: console_manager.register_command(lambda: "late", ["late"], "Late command"),
+        ["register"],
+        "Register late command"
+    )
+    commands = console_manager.commands
+
+    assert console_manager.dispatch("register").ok
+    assert "late" not in commands
+    assert console_manager.dispatch("late").result == "late"
+
+
+def test_execute_line_prints_error(console_manager):
+    console_manager.execute_line("sum 1 x")
+    output = console_manager.console.file.getvalue()
+    assert "invalid literal for int()" in output
+    assert "Usage: sum" in output
+
+
+def test_dispatch_from_several_threads(console_manager):
+    thread_count = 8
+    ops = 200
+    barrier = threading.Barrier(thread_count + 1)
+    results = [[] for _ in range(thread_count)]
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        for i in range(ops):
+            results[index].append(console_manager.dispatch(f"sum -p {i} -1 {index}"))
+
+    def registrar() -> None:
+        barrier.wait()
+        for i in range(ops):
+            console_manager.register_command(lambda: None, [f"cmd{i}"], "Stress command")
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(thread_count)]
+    threads.append(threading.Thread(target=registrar))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for index, dispatch_results in enumerate(results):
+        assert len(dispatch_results) == ops
+        for i, dispatch_result in enumerate(dispatch_results):
+            assert dispatch_result.ok
+            assert dispatch_result.result == i + index
+    assert all(f"cmd{i}" in console_manager.commands for i in range(ops))
+
+
+def test_command_execute_prints_error_to_console(console_manager):
+    console = Console(file=io.StringIO(), width=120)
+    assert console_manager.commands["sum"].execute("1", "x", console=console) is None
+    output = console.file.getvalue()
+    assert "invalid literal for int()" in output
+    assert "Usage: sum" in output
+
+
+def test_param_execute_prints_error_to_console(console_manager):
+    console = Console(file=io.StringIO(), width=120)
+    param = console_manager.commands["help"].params["-p"]
+    assert param.execute(console=console) is None
+    assert "Usage: help -p <command>" in console.file.getvalue()